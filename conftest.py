@@ -2,6 +2,8 @@
 
 import pytest
 
+from arrow_odbc import log_to_stderr, enable_odbc_connection_pooling
+
 
 def pytest_addoption(parser):
     parser.addoption("--runslow", action="store_true", default=False, help="run slow tests")
@@ -9,6 +11,13 @@ def pytest_addoption(parser):
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "slow: mark test as slow to run")
+    config.addinivalue_line(
+        "markers", "no_database: test does not require SQL Server to be reachable"
+    )
+    # Process wide initialization of arrow-odbc. Happens exactly once per process, also for each
+    # worker if running in parallel with pytest-xdist.
+    log_to_stderr()
+    enable_odbc_connection_pooling()
 
 
 def pytest_collection_modifyitems(config, items):
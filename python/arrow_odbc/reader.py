@@ -184,6 +184,25 @@ class BatchReader:
         else:
             return batch
 
+    def __enter__(self):
+        # Implement context manager protocol, so the reader can be closed deterministically.
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Frees the cursor and closes the connection of the reader (or returns it to the pool, in case
+        connection pooling is enabled), without waiting for the garbage collector. Afterwards the
+        reader is empty and does not yield any more batches. Calling this method on an already
+        closed reader has no effect.
+        """
+        # Replacing the reader with an empty one, drops the last reference to the old one and frees
+        # its resources.
+        self.reader = _BatchReaderRaii()
+        self.schema = self.reader.schema()
+
     def more_results(
         self,
         batch_size: int = 65535,
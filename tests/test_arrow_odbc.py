@@ -1,15 +1,18 @@
 import datetime
+import gc
 import os
+import re
+import tracemalloc
 
 import pyarrow as pa
+import pyarrow.csv as csv
 import pyarrow.parquet as pq
 
 import duckdb
 import pytest
 import pyodbc
 
-from typing import List, Any
-from subprocess import check_output
+from typing import Any, List
 
 from pytest import raises
 
@@ -18,37 +21,204 @@ from arrow_odbc import (
     from_table_to_db,
     read_arrow_batches_from_odbc,
     log_to_stderr,
-    enable_odbc_connection_pooling,
     Error,
 )
 
-MSSQL = "Driver={ODBC Driver 18 for SQL Server};Server=localhost;UID=SA;PWD=My@Test@Password1;\
-    TrustServerCertificate=yes;"
+# Keep this free of whitespace. The driver manager compares connection strings byte by byte, if
+# looking for a pooled connection. The tests assert on types and error messages of Microsoft SQL
+# Server, so ARROW_ODBC_TEST_DSN may point to a different instance, but not to another database.
+MSSQL = os.environ.get(
+    "ARROW_ODBC_TEST_DSN",
+    "Driver={ODBC Driver 18 for SQL Server};Server=localhost;UID=SA;PWD=My@Test@Password1;"
+    "TrustServerCertificate=yes;",
+)
+
+# Id of the pytest-xdist worker executing the tests, e.g. "gw0". Used to give each worker its own
+# tables. Read from the environment rather than the `worker_id` fixture, so the tests also run
+# without pytest-xdist installed.
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "master")
 
-log_to_stderr()
-enable_odbc_connection_pooling()
+# Columns of the table we use to hold the iris data set
+IRIS_COLUMNS = (
+    "sepal_length REAL, sepal_width REAL, petal_length REAL, petal_width REAL, variety VARCHAR(20)"
+)
 
+# Schemas shared between many tests. Built once, rather than in every test.
+SCHEMA_A_INT32 = pa.schema([("a", pa.int32())])
+SCHEMA_A_INT64 = pa.schema([("a", pa.int64())])
+SCHEMA_A_UTF8 = pa.schema([("a", pa.utf8())])
+SCHEMA_A_TIMESTAMP_US = pa.schema([("a", pa.timestamp("us"))])
+SCHEMA_A_TIMESTAMP_NS = pa.schema([("a", pa.timestamp("ns"))])
+# Schema of a reader without a result set
+EMPTY_SCHEMA = pa.schema([])
+
+# Expected results of tests. Record batches are immutable, so they can safely be shared.
+EXPECTED_ONE_ROW_42 = pa.RecordBatch.from_pydict({"a": [42]}, SCHEMA_A_INT32)
+EXPECTED_TIMESTAMP_US = pa.RecordBatch.from_pydict({"a": [1397510742074841]}, SCHEMA_A_TIMESTAMP_US)
+EXPECTED_TIMESTAMP_NS = pa.RecordBatch.from_pydict(
+    {"a": [1397510742074841200]}, SCHEMA_A_TIMESTAMP_NS
+)
+
+
+@pytest.fixture(scope="session")
+def admin_conn():
+    """
+    A single pyodbc connection shared by all tests in order to setup tables and verify their
+    contents. Avoids paying for the login each time we need to prepare a precondition.
 
-def setup_table(table: str, column_type: str, values: List[Any]):
-    connection = pyodbc.connect(MSSQL)
-    connection.execute(f"DROP TABLE IF EXISTS {table};")
-    connection.execute(f"CREATE TABLE {table} (a {column_type});")
-    for value in values:
-        connection.execute(f"INSERT INTO {table} (a) VALUES (?);", value)
-    connection.commit()
+    Opening it doubles as a probe for the database. If it is unreachable, tests requiring it are
+    skipped locally, rather than each of them waiting for the login timeout. On CI (`CI` is set)
+    they fail, so a missing database can not pass unnoticed.
+    """
+    try:
+        # Tests do not need transactions. With autocommit we save the roundtrip for committing.
+        connection = pyodbc.connect(MSSQL, autocommit=True, timeout=2)
+    except pyodbc.Error as error:
+        message = f"SQL Server unavailable: {error}"
+        if os.environ.get("CI"):
+            pytest.fail(message)
+        pytest.skip(message)
+    yield connection
     connection.close()
 
 
-def empty_table(table, column_type):
+@pytest.fixture(scope="session")
+def _warm_up_connection_pool(admin_conn):
+    """
+    Open a connection with arrow-odbc before the first test runs. It is returned to the connection
+    pool afterwards, so the first test does not pay for the login alone. This keeps the duration
+    of individual tests comparable.
+    """
+    drain_one(read_arrow_batches_from_odbc(query="SELECT 1 AS a", connection_string=MSSQL))
+
+
+@pytest.fixture(autouse=True)
+def _database(request):
+    """
+    Make sure the database is reachable before running a test. Tests marked with `no_database` do
+    not talk to SQL Server, and also run without it.
+    """
+    if request.node.get_closest_marker("no_database") is None:
+        request.getfixturevalue("_warm_up_connection_pool")
+
+
+@pytest.fixture(scope="session")
+def iris_table():
+    """
+    The iris data set as an arrow table. Decoded from parquet only once per test session.
+    """
+    return pq.read_table("./tests/iris.parquet")
+
+
+@pytest.fixture(scope="module")
+def shared_one_row_table(admin_conn):
+    """
+    A table with a single integer column 'a' holding one row with the value 42. Shared between all
+    tests which only read from it, so it is created only once.
+    """
+    table = f"SharedOneRow_{WORKER_ID}"
+    setup_table(admin_conn, table=table, column_type="int", values=["42"])
+    return table
+
+
+@pytest.fixture(scope="module")
+def shared_abcd_table(admin_conn):
+    """
+    A table with the columns 'a' CHAR(1) and 'b' INTEGER, holding the rows ('A', 1), ('B', 2),
+    ('C', 3) and ('D', 4). Shared between all tests which only read from it.
+    """
+    table = f"SharedAbcd_{WORKER_ID}"
+    # Drop, create and fill the table in a single batch, to spare us roundtrips
+    admin_conn.execute(
+        f"DROP TABLE IF EXISTS {table};"
+        f"CREATE TABLE {table} (a CHAR(1), b INTEGER);"
+        f"INSERT INTO {table} (a,b) VALUES ('A',1),('B',2),('C',3),('D',4);"
+    )
+    return table
+
+
+@pytest.fixture(scope="session")
+def shared_iris_table(admin_conn):
+    """
+    A table holding the iris data set. Shared between all tests which only read from it, so the
+    data is only loaded once per session.
+    """
+    table = f"SharedIris_{WORKER_ID}"
+    create_table(admin_conn, table, IRIS_COLUMNS)
+    # Insert all rows in one bulk roundtrip using the columnar inserter of arrow-odbc
+    iris = csv.read_csv("./tests/iris.csv")
+    from_table_to_db(source=iris, target=table, connection_string=MSSQL)
+    return table
+
+
+@pytest.fixture
+def table_name(request):
+    """
+    Name of a table owned exclusively by the requesting test. Including the id of the xdist worker
+    allows tests to run in parallel, without different workers stepping on each others tables.
+    """
+    # Use the full node name, so each parametrization owns its own table. Parametrized tests contain
+    # brackets and other characters in their name, which are not valid in an unquoted identifier.
+    return re.sub(r"\W", "_", f"{request.node.name}_{WORKER_ID}")
+
+
+def drain_one(reader):
+    """
+    Consume the reader and assert that it yields exactly one batch, which is returned.
+    """
+    batches = list(reader)
+    assert len(batches) == 1
+    return batches[0]
+
+
+def drain_none(reader):
+    """
+    Consume the reader and assert that it does not yield any batch.
+    """
+    assert list(reader) == []
+
+
+def read_column_a(query: str, batch_size: int = 100, **kwargs) -> List[Any]:
+    """
+    Execute the query using arrow-odbc and return the values of column 'a' as a Python list.
+    Keyword arguments are forwarded to `read_arrow_batches_from_odbc`. The batch size defaults to a
+    small value, since the tests read only few rows and the transit buffer scales with it.
+    """
+    reader = read_arrow_batches_from_odbc(
+        query=query, batch_size=batch_size, connection_string=MSSQL, **kwargs
+    )
+    batches = list(reader)
+    return pa.Table.from_batches(batches, reader.schema).column("a").to_pylist()
+
+
+def create_table(connection, table: str, columns: str):
+    """
+    (Re)create a table with the given column definitions. Dropping and creating the table is sent
+    as one batch, so it only takes a single roundtrip.
+    """
+    connection.execute(f"DROP TABLE IF EXISTS {table}; CREATE TABLE {table} ({columns});")
+
+
+def setup_table(connection, table: str, column_type: str, values: List[str]):
+    create_table(connection, table, f"a {column_type}")
+    # Send all values in one roundtrip, rather than one statement per row
+    if values:
+        cursor = connection.cursor()
+        cursor.fast_executemany = True
+        # All values are passed as text and converted by the database. Declaring the parameter
+        # type upfront spares pyodbc from asking the driver to describe the parameter of the
+        # prepared statement.
+        max_len = max(len(v) for v in values)
+        cursor.setinputsizes([(pyodbc.SQL_VARCHAR, max_len, 0)])
+        cursor.executemany(f"INSERT INTO {table} (a) VALUES (?);", [(v,) for v in values])
+
+
+def empty_table(connection, table, column_type):
     """
     Create an empty table as a precondition for a test. The table will have an identy column (id)
     and an additional column of the custom type with typename a
     """
-    connection = pyodbc.connect(MSSQL)
-    connection.execute(f"DROP TABLE IF EXISTS {table};")
-    connection.execute(f"CREATE TABLE {table} (id int IDENTITY(1,1), a {column_type});")
-    connection.commit()
-    connection.close()
+    create_table(connection, table, f"id int IDENTITY(1,1), a {column_type}")
 
 
 def test_connection_options():
@@ -61,47 +231,56 @@ def test_connection_options():
     )
 
 
-def test_should_report_error_on_invalid_connection_string_reading():
+@pytest.mark.parametrize(
+    "query,connection_string,match",
+    [
+        # Error on windows: Data source name not found and no default driver specified
+        # Erron on linux: Data source name not found, and no default driver specified
+        # We assert on less, so we don't care about the comma (,)
+        pytest.param(
+            "SELECT * FROM Table",
+            "foo",
+            "Data source name not found",
+            marks=pytest.mark.no_database,
+            id="invalid_connection_string",
+        ),
+        # 'Foo' does not exist in the datasource
+        pytest.param("SELECT * FROM Foo", MSSQL, "Invalid object name 'Foo'", id="invalid_query"),
+        pytest.param(
+            "SELECT CAST('a' AS VARCHAR(MAX)) as a",
+            MSSQL,
+            "ODBC driver did not specify a sensible upper bound for the column",
+            id="zero_sized_column",
+        ),
+    ],
+)
+def test_should_report_error_on_read(query, connection_string, match):
     """
-    We want to forward the original ODBC errors to the end user. Of course foo
-    is not a valid connection string. Therefore we want to see the creation of
-    this connection fail, but with a nice error.
+    We want to forward the original ODBC errors to the end user, so they know why creating the
+    reader failed. A short login timeout bounds how long each case may wait on the data source.
     """
-    # Error on windows: Data source name not found and no default driver specified
-    # Erron on linux: Data source name not found, and no default driver specified
-    # We assert on less, so we don't care about the comma (,)
-    with raises(Error, match="Data source name not found"):
+    with raises(Error, match=match):
         read_arrow_batches_from_odbc(
-            query="SELECT * FROM Table", batch_size=100, connection_string="foo"
+            query=query,
+            batch_size=100,
+            connection_string=connection_string,
+            login_timeout_sec=2,
         )
 
 
-def test_should_report_error_on_invalid_query():
-    """
-    We want the user to know why a query failed.
-    """
-
-    # 'Foo' does not exist in the datasource
-    query = "SELECT * FROM Foo"
-
-    with raises(Error, match="Invalid object name 'Foo'"):
-        read_arrow_batches_from_odbc(query=query, batch_size=100, connection_string=MSSQL)
-
-
-def test_no_result_set():
+def test_no_result_set(admin_conn, table_name):
     """
     BatchReader should be be empty if no result set can be produced
     """
-    table = "EmptyResult"
-    setup_table(table=table, column_type="int", values=[])
+    table = table_name
+    setup_table(admin_conn, table=table, column_type="int", values=[])
 
     # This statement does not produce a result set
     query = f"INSERT INTO {table} (a) VALUES (42);"
     reader = read_arrow_batches_from_odbc(query=query, batch_size=100, connection_string=MSSQL)
 
-    assert reader.schema == pa.schema([])
-    with raises(StopIteration):
-        next(iter(reader))
+    assert reader.schema == EMPTY_SCHEMA
+    drain_none(reader)
 
 
 def test_skip_to_second_result_set():
@@ -120,9 +299,7 @@ def test_skip_to_second_result_set():
     schema = pa.schema([pa.field("b", pa.int32(), nullable=False)])
     assert reader.schema == schema
     expected = pa.RecordBatch.from_pydict({"b": [2]}, schema)
-    assert expected == next(iter(reader))
-    with raises(StopIteration):
-        next(iter(reader))
+    assert expected == drain_one(reader)
 
 
 def test_more_results_return_should_indicate_if_there_is_a_result_set():
@@ -148,9 +325,9 @@ def test_custom_schema_for_second_result_set():
 
     reader = read_arrow_batches_from_odbc(query=query, batch_size=1, connection_string=MSSQL)
     # Ignore first result and use second straight away
-    schema = pa.schema([pa.field("a", pa.string())])
+    schema = SCHEMA_A_UTF8
     reader.more_results(batch_size=1, schema=schema)
-    batch = next(iter(reader))
+    batch = drain_one(reader)
 
     expected = pa.RecordBatch.from_pydict({"a": ["2"]}, schema)
     assert batch == expected
@@ -169,9 +346,8 @@ def test_advancing_past_last_result_set_leaves_empty_reader():
     reader.more_results(batch_size=100)
 
     # Assert schema and batches are empty
-    assert reader.schema == pa.schema([])
-    with raises(StopIteration):
-        next(iter(reader))
+    assert reader.schema == EMPTY_SCHEMA
+    drain_none(reader)
 
 
 def test_making_an_empty_reader_concurrent_is_no_error():
@@ -186,184 +362,165 @@ def test_making_an_empty_reader_concurrent_is_no_error():
     reader.more_results(batch_size=100, fetch_concurrently=True)
 
     # Assert schema and batches are empty
-    assert reader.schema == pa.schema([])
-    with raises(StopIteration):
-        next(iter(reader))
+    assert reader.schema == EMPTY_SCHEMA
+    drain_none(reader)
 
 
-def test_empty_table():
+def test_empty_table(admin_conn, table_name):
     """
     Should return an empty iterator querying an empty table.
     """
-    table = "Empty"
-    setup_table(table=table, column_type="int", values=[])
+    table = table_name
+    setup_table(admin_conn, table=table, column_type="int", values=[])
 
     query = f"SELECT * FROM {table}"
 
     reader = read_arrow_batches_from_odbc(query=query, batch_size=100, connection_string=MSSQL)
 
-    with raises(StopIteration):
-        next(iter(reader))
-
-
-def test_one_row():
+    drain_none(reader)
+
+
+@pytest.mark.parametrize(
+    "column_type, literal, expected",
+    [
+        ("INT", "42", EXPECTED_ONE_ROW_42),
+        ("DATETIME2(6)", "'2014-04-14 21:25:42.074841'", EXPECTED_TIMESTAMP_US),
+        # 'ab' is char(2) => 2 bytes on database. Yet, only one UTF-16 character can fit into 2
+        # bytes.
+        ("CHAR(2)", "'ab'", pa.RecordBatch.from_pydict({"a": ["ab"]}, SCHEMA_A_UTF8)),
+        # '™' is 3 bytes in UTF-8, but only 2 bytes in UTF-16
+        ("NCHAR(1)", "N'™'", pa.RecordBatch.from_pydict({"a": ["™"]}, SCHEMA_A_UTF8)),
+        # 'Ü' is larger in bytes than in characters in UTF-8
+        ("VARCHAR(1)", "'Ü'", pa.RecordBatch.from_pydict({"a": ["Ü"]}, SCHEMA_A_UTF8)),
+    ],
+    ids=["int", "timestamp_us", "char", "wchar", "umlaut"],
+)
+def test_one_row(column_type, literal, expected, admin_conn, table_name):
     """
-    Query a table with one row. Should return one batch
+    Query a table with one row of various column types. Should return one batch
     """
-    table = "OneRow"
-    setup_table(table=table, column_type="int", values=["42"])
+    table = table_name
+    # Drop, create and fill the table in a single batch, to spare us roundtrips
+    admin_conn.execute(
+        f"DROP TABLE IF EXISTS {table};"
+        f"CREATE TABLE {table} (a {column_type});"
+        f"INSERT INTO {table} (a) VALUES ({literal});"
+    )
 
     query = f"SELECT * FROM {table}"
+    reader = read_arrow_batches_from_odbc(query=query, batch_size=1, connection_string=MSSQL)
+    actual = drain_one(reader)
 
-    reader = read_arrow_batches_from_odbc(query=query, batch_size=100, connection_string=MSSQL)
-    it = iter(reader)
-
-    actual = next(it)
-
-    schema = pa.schema([("a", pa.int32())])
-    expected = pa.RecordBatch.from_pydict({"a": [42]}, schema)
     assert expected == actual
 
-    with raises(StopIteration):
-        next(it)
-
 
-def test_fetch_concurrently():
+@pytest.mark.parametrize("fetch_concurrently", [True, False], ids=["concurrent", "sequential"])
+def test_fetch(fetch_concurrently, shared_one_row_table):
     """
-    Use a concurrent batch reader to fetch one row
+    Use a concurrent or sequential batch reader to fetch one row
     """
-    table = "FetchConcurrently"
-    setup_table(table=table, column_type="int", values=["42"])
-
-    query = f"SELECT * FROM {table}"
+    query = f"SELECT * FROM {shared_one_row_table}"
 
     reader = read_arrow_batches_from_odbc(
-        query=query, batch_size=100, connection_string=MSSQL, fetch_concurrently=True
+        query=query, batch_size=1, connection_string=MSSQL, fetch_concurrently=fetch_concurrently
     )
-    it = iter(reader)
-
-    actual = next(it)
+    actual = drain_one(reader)
 
-    schema = pa.schema([("a", pa.int32())])
-    expected = pa.RecordBatch.from_pydict({"a": [42]}, schema)
-    assert expected == actual
-
-    with raises(StopIteration):
-        next(it)
+    assert EXPECTED_ONE_ROW_42 == actual
 
 
-def test_fetch_sequential():
+def test_close_reader_with_context_manager(shared_one_row_table):
     """
-    Use a sequential batch reader to fetch one row
+    Leaving the with block closes the reader, even though the batch has not been fetched yet.
+    Afterwards the reader is empty.
     """
-    table = "FetchConcurrently"
-    setup_table(table=table, column_type="int", values=["42"])
-
-    query = f"SELECT * FROM {table}"
-
-    reader = read_arrow_batches_from_odbc(
-        query=query, batch_size=100, connection_string=MSSQL, fetch_concurrently=False
-    )
-    it = iter(reader)
+    query = f"SELECT * FROM {shared_one_row_table}"
 
-    actual = next(it)
+    with read_arrow_batches_from_odbc(query=query, batch_size=1, connection_string=MSSQL) as reader:
+        assert reader.schema == SCHEMA_A_INT32
 
-    schema = pa.schema([("a", pa.int32())])
-    expected = pa.RecordBatch.from_pydict({"a": [42]}, schema)
-    assert expected == actual
-
-    with raises(StopIteration):
-        next(it)
+    assert reader.schema == EMPTY_SCHEMA
+    drain_none(reader)
 
 
-def test_schema():
+def test_close_reader_twice(shared_one_row_table):
     """
-    Query a table. Reader should have a member indicating the correct schema
+    Closing a reader leaves it empty. Closing it a second time has no effect.
     """
-    table = "TestSchema"
-    connection = pyodbc.connect(MSSQL)
-    connection.execute(f"DROP TABLE IF EXISTS {table};")
-    connection.execute(f"CREATE TABLE {table} (a INT, b VARCHAR);")
-    connection.commit()
-    connection.close()
+    query = f"SELECT * FROM {shared_one_row_table}"
+    reader = read_arrow_batches_from_odbc(query=query, batch_size=1, connection_string=MSSQL)
 
-    query = f"SELECT * FROM {table}"
-    reader = read_arrow_batches_from_odbc(query=query, batch_size=100, connection_string=MSSQL)
+    reader.close()
+    reader.close()
 
-    expected = pa.schema([("a", pa.int32()), ("b", pa.string())])
-    assert expected == reader.schema
+    assert reader.schema == EMPTY_SCHEMA
+    drain_none(reader)
 
 
-def test_schema_from_concurrent_reader():
+def test_fetch_concurrently_many_batches():
     """
-    Query a table concurrently. Reader should have a member indicating the correct schema
+    Fetch a result set spanning many large batches concurrently, so the transit buffers are
+    swapped between the fetching thread and the main thread more than once.
     """
-    table = "TestSchemaFromConcurrentReader"
-    connection = pyodbc.connect(MSSQL)
-    connection.execute(f"DROP TABLE IF EXISTS {table};")
-    connection.execute(f"CREATE TABLE {table} (a INT, b VARCHAR);")
-    connection.commit()
-    connection.close()
+    num_rows = 10_000
+    # Without ORDER BY, neither the order of the rows, nor which row numbers TOP picks is defined
+    query = (
+        f"SELECT TOP {num_rows} CAST(ROW_NUMBER() OVER (ORDER BY (SELECT NULL)) AS INT) AS a "
+        "FROM sys.all_objects x CROSS JOIN sys.all_objects y ORDER BY a"
+    )
 
-    query = f"SELECT * FROM {table}"
     reader = read_arrow_batches_from_odbc(
-        query=query, batch_size=100, connection_string=MSSQL, fetch_concurrently=True
+        query=query, batch_size=1_000, connection_string=MSSQL, fetch_concurrently=True
     )
+    batches = list(reader)
 
-    expected = pa.schema([("a", pa.int32()), ("b", pa.string())])
-    assert expected == reader.schema
+    assert len(batches) == 10
+    actual = pa.Table.from_batches(batches, reader.schema).column("a").to_pylist()
+    assert actual == list(range(1, num_rows + 1))
 
 
-def test_timestamp_us():
+@pytest.mark.parametrize("fetch_concurrently", [True, False], ids=["concurrent", "sequential"])
+def test_schema(fetch_concurrently, admin_conn, table_name):
     """
-    Query a table with one row. Should return one batch
+    Query a table. Reader should have a member indicating the correct schema, independent of
+    wether it fetches concurrently or not.
     """
-    table = "TimestampUs"
-    setup_table(table=table, column_type="DATETIME2(6)", values=["2014-04-14 21:25:42.074841"])
+    table = table_name
+    create_table(admin_conn, table, "a INT, b VARCHAR")
 
     query = f"SELECT * FROM {table}"
-    reader = read_arrow_batches_from_odbc(query=query, batch_size=100, connection_string=MSSQL)
-    it = iter(reader)
-    actual = next(it)
-
-    schema = pa.schema([("a", pa.timestamp("us"))])
-    expected = pa.RecordBatch.from_pydict({"a": [1397510742074841]}, schema)
-    print(expected[0])
-    print(actual[0])
-    assert expected == actual
+    reader = read_arrow_batches_from_odbc(
+        query=query, batch_size=100, connection_string=MSSQL, fetch_concurrently=fetch_concurrently
+    )
 
-    with raises(StopIteration):
-        next(it)
+    expected = pa.schema([("a", pa.int32()), ("b", pa.string())])
+    assert expected == reader.schema
 
 
-def test_timestamp_ns():
+def test_timestamp_ns(admin_conn, table_name):
     """
     Query a table with one row. Should return one batch
     """
-    table = "TimestampNs"
-    setup_table(table=table, column_type="DATETIME2(7)", values=["2014-04-14 21:25:42.0748412"])
+    table = table_name
+    setup_table(
+        admin_conn, table=table, column_type="DATETIME2(7)", values=["2014-04-14 21:25:42.0748412"]
+    )
 
     query = f"SELECT * FROM {table}"
-    reader = read_arrow_batches_from_odbc(query=query, batch_size=100, connection_string=MSSQL)
-    it = iter(reader)
-    actual = next(it)
-
-    schema = pa.schema([("a", pa.timestamp("ns"))])
-    expected = pa.RecordBatch.from_pydict({"a": [1397510742074841200]}, schema)
-    print(expected[0])
-    print(actual[0])
-    assert expected == actual
+    reader = read_arrow_batches_from_odbc(query=query, batch_size=1, connection_string=MSSQL)
+    actual = drain_one(reader)
 
-    with raises(StopIteration):
-        next(it)
+    assert EXPECTED_TIMESTAMP_NS == actual
 
 
-def test_out_of_range_timestamp_ns():
+def test_out_of_range_timestamp_ns(admin_conn, table_name):
     """
     Query a table with one row. Should return one batch
     """
-    table = "OutOfRangeTimestampNs"
-    setup_table(table=table, column_type="DATETIME2(7)", values=["2300-04-14 21:25:42.0748412"])
+    table = table_name
+    setup_table(
+        admin_conn, table=table, column_type="DATETIME2(7)", values=["2300-04-14 21:25:42.0748412"]
+    )
 
     query = f"SELECT * FROM {table}"
 
@@ -383,10 +540,15 @@ def test_specify_user_and_password_separatly():
 
     query = "SELECT 42 as a;"
 
+    # Take the credentials out of the connection string, so they are only passed separately
+    uid = re.search(r"\bUID=([^;]*)(;|$)", MSSQL, re.IGNORECASE)
+    pwd = re.search(r"\bPWD=([^;]*)(;|$)", MSSQL, re.IGNORECASE)
+    if uid is None or pwd is None:
+        pytest.skip("ARROW_ODBC_TEST_DSN does not contain UID and PWD")
+    user = uid.group(1)
+    password = pwd.group(1)
     # Connection string without credentials
-    connection_string = "Driver={ODBC Driver 17 for SQL Server};Server=localhost;"
-    user = "SA"
-    password = "My@Test@Password1"
+    connection_string = MSSQL.replace(uid.group(0), "").replace(pwd.group(0), "")
 
     reader = read_arrow_batches_from_odbc(
         query=query,
@@ -396,137 +558,46 @@ def test_specify_user_and_password_separatly():
         password=password,
     )
 
-    it = iter(reader)
-    _result = next(it)
-    with raises(StopIteration):
-        next(it)
-
-
-def test_query_char():
-    """
-    Query a string those UTF-16 representation is larger than the maximum binary column length on
-    the database.
-    """
-    # 'ab' is char(2) => 2 bytes on database. Yet, only one UTF-16 character can fit into 2 bytes.
-    query = "SELECT 'ab' as a"
-    reader = read_arrow_batches_from_odbc(query=query, batch_size=100, connection_string=MSSQL)
-
-    it = iter(reader)
-    batch = next(it)
-    actual = batch.to_pydict()
-    expected = {"a": ["ab"]}
-
-    assert expected == actual
-
-
-def test_query_wchar():
-    """
-    Query a string those UTF-8 representation is larger than the maximum binary column length on
-    the database.
-    """
-    # '™' is 3 bytes in UTF-8, but only 2 bytes in UTF-16
-    query = "SELECT CAST('™' AS NCHAR(1)) as a"
-    reader = read_arrow_batches_from_odbc(query=query, batch_size=100, connection_string=MSSQL)
-
-    it = iter(reader)
-    batch = next(it)
-    actual = batch.to_pydict()
-    expected = {"a": ["™"]}
-
-    assert expected == actual
-
-
-def test_query_umlaut():
-    """
-    Query a string those UTF-8 representation is larger in bytes than in
-    characters.
-    """
-    query = "SELECT CAST('Ü' AS VARCHAR(1)) as a"
-    reader = read_arrow_batches_from_odbc(query=query, batch_size=100, connection_string=MSSQL)
-
-    it = iter(reader)
-    batch = next(it)
-    actual = batch.to_pydict()
-    expected = {"a": ["Ü"]}
-
-    assert expected == actual
+    drain_one(reader)
 
 
-def test_query_zero_sized_column():
-    """
-    Query a string those UTF-8 representation is larger in bytes than in
-    characters.
-    """
-    query = "SELECT CAST('a' AS VARCHAR(MAX)) as a"
-    with raises(Error, match="ODBC driver did not specify a sensible upper bound for the column"):
-        read_arrow_batches_from_odbc(query=query, batch_size=100, connection_string=MSSQL)
-
-
-def test_query_with_string_parameter():
+def test_query_with_string_parameter(shared_abcd_table):
     """
     Use a string parameter in a where clause and verify that the result is
     filtered accordingly
     """
-    table = "QueryWithStringParameter"
-    connection = pyodbc.connect(MSSQL)
-    connection.execute(f"DROP TABLE IF EXISTS {table};")
-    connection.execute(f"CREATE TABLE {table} (a CHAR(1), b INTEGER);")
-    connection.execute(f"INSERT INTO {table} (a,b) VALUES ('A', 1),('B',2),('C',3),('D',4);")
-    connection.commit()
-    connection.close()
+    table = shared_abcd_table
     query = f"SELECT b FROM {table} WHERE a=?;"
 
     reader = read_arrow_batches_from_odbc(
-        query=query, batch_size=10, connection_string=MSSQL, parameters=["B"]
+        query=query, batch_size=1, connection_string=MSSQL, parameters=["B"]
     )
-    it = iter(reader)
-
-    actual = next(it)
+    actual = drain_one(reader)
 
     schema = pa.schema([("b", pa.int32())])
     expected = pa.RecordBatch.from_pydict({"b": [2]}, schema)
     assert expected == actual
 
-    with raises(StopIteration):
-        next(it)
-
 
-def test_query_with_none_parameter():
+def test_query_with_none_parameter(shared_abcd_table):
     """
     Use a string parameter in a where clause and verify that the result is
     filtered accordingly
     """
-    table = "QueryWithNoneParameter"
-    connection = pyodbc.connect(MSSQL)
-    connection.execute(f"DROP TABLE IF EXISTS {table};")
-    connection.execute(f"CREATE TABLE {table} (a CHAR(1), b INTEGER);")
-    connection.execute(f"INSERT INTO {table} (a,b) VALUES ('A', 1),('B',2),('C',3),('D',4);")
-    connection.commit()
-    connection.close()
-
+    table = shared_abcd_table
     query = f"SELECT b FROM {table} WHERE a=?;"
 
     reader = read_arrow_batches_from_odbc(
         query=query, batch_size=10, connection_string=MSSQL, parameters=[None]
     )
-    it = iter(reader)
+    drain_none(reader)
 
-    with raises(StopIteration):
-        next(it)
 
-
-def test_query_with_int_parameter():
+def test_query_with_int_parameter(shared_abcd_table):
     """
     Use an int parameter in a where clause and verify that the result is filtered accordingly
     """
-    table = "QueryWithIntParameter"
-    connection = pyodbc.connect(MSSQL)
-    connection.execute(f"DROP TABLE IF EXISTS {table};")
-    connection.execute(f"CREATE TABLE {table} (a CHAR(1), b INTEGER);")
-    connection.execute(f"INSERT INTO {table} (a,b) VALUES ('A', 1),('B',2),('C',3),('D',4);")
-    connection.commit()
-    connection.close()
-
+    table = shared_abcd_table
     query = f"SELECT a FROM {table} WHERE #b=?;"
     with raises(
         TypeError,
@@ -547,19 +618,18 @@ def test_query_timestamp_as_date():
     reader = read_arrow_batches_from_odbc(
         query=query, batch_size=1, connection_string=MSSQL, schema=schema
     )
-    it = iter(reader)
-    batch = next(it)
+    batch = drain_one(reader)
     value = batch.to_pydict()
 
     assert value == {"a": [datetime.date(2023, 12, 24)]}
 
 
-def test_allocation_erros():
+def test_allocation_erros(admin_conn, table_name):
     """
     Avoids unrecoverable allocation errors, if querying an image column
     """
-    table = "AllocationError"
-    setup_table(table=table, column_type="Image", values=[])
+    table = table_name
+    setup_table(admin_conn, table=table, column_type="Image", values=[])
 
     query = f"SELECT * FROM {table}"
 
@@ -574,31 +644,64 @@ def test_allocation_erros():
         )
 
 
-def test_iris():
+def test_max_bytes_per_batch_too_small_for_one_row(admin_conn, table_name):
     """
-    Validate usage works like in the readme
+    If a single row does not fit into the memory limit, we want to fail up front, without even
+    trying to allocate the buffers.
     """
-    table = "Iris"
-    os.system(f'odbcsv fetch -c "{MSSQL}" -q "DROP TABLE IF EXISTS {table};"')
-    os.system(
-        f'odbcsv fetch -c "{MSSQL}" -q "CREATE TABLE {table} (sepal_length REAL, sepal_width REAL, petal_length REAL, petal_width REAL, variety VARCHAR(20) )"'
-    )
-    os.system(f'odbcsv insert -c "{MSSQL}" -i ./tests/iris.csv {table}')
+    table = table_name
+    setup_table(admin_conn, table=table, column_type="Image", values=[])
 
     query = f"SELECT * FROM {table}"
 
+    with raises(Error, match="not large enough to hold a single row"):
+        _reader = read_arrow_batches_from_odbc(
+            query=query,
+            batch_size=1_000_000,
+            max_bytes_per_batch=10_000_000,
+            connection_string=MSSQL,
+        )
+
+
+def test_max_bytes_per_batch_limits_rows_of_wide_columns():
+    """
+    A huge batch size should be fine for wide columns, as long as the memory limit caps the number
+    of rows in the transit buffer.
+    """
+    query = "SELECT TOP 100 CAST(CRYPT_GEN_RANDOM(16) AS VARBINARY(2048)) AS a FROM sys.all_objects"
+    max_bytes_per_batch = 20 * 2048
+
+    reader = read_arrow_batches_from_odbc(
+        query=query,
+        batch_size=1_000_000,
+        max_bytes_per_batch=max_bytes_per_batch,
+        connection_string=MSSQL,
+    )
+    batches = list(reader)
+
+    # Each row requires at least 2048 bytes, so the limit allows for no more than 20 rows per batch
+    assert all(batch.num_rows <= 20 for batch in batches)
+    assert sum(batch.num_rows for batch in batches) == 100
+
+
+def test_iris(shared_iris_table):
+    """
+    Validate usage works like in the readme
+    """
+    query = f"SELECT * FROM {shared_iris_table}"
+
     reader = read_arrow_batches_from_odbc(query=query, batch_size=100, connection_string=MSSQL)
 
-    for batch in reader:
-        _df = batch.to_pydict()
+    total = sum(batch.num_rows for batch in reader)
+    assert total == 150
 
 
-def test_image():
+def test_image(admin_conn, table_name):
     """
     Avoids error allocating image column by using casts.
     """
-    table = "Image"
-    setup_table(table=table, column_type="Image", values=[])
+    table = table_name
+    setup_table(admin_conn, table=table, column_type="Image", values=[])
     query = f"SELECT CAST(a as VARBINARY(2048)) FROM {table}"
 
     _reader = read_arrow_batches_from_odbc(
@@ -608,22 +711,21 @@ def test_image():
     )
 
 
-def test_support_varchar_max():
+def test_support_varchar_max(admin_conn, table_name):
     """
     Support fetching values from a VARCHAR(max) column, by specifying an upper
     bound for the values in it.
     """
     # Given
-    table = "SupportVarcharMax"
-    setup_table(table=table, column_type="VARCHAR(max)", values=["Hello, World!"])
+    table = table_name
+    setup_table(admin_conn, table=table, column_type="VARCHAR(max)", values=["Hello, World!"])
     query = f"SELECT (a) FROM {table}"
 
     # When
     reader = read_arrow_batches_from_odbc(
-        query=query, batch_size=1000, connection_string=MSSQL, max_text_size=1024
+        query=query, batch_size=1, connection_string=MSSQL, max_text_size=1024
     )
-    it = iter(reader)
-    batch = next(it)
+    batch = drain_one(reader)
 
     # Then
     actual = batch.to_pydict()
@@ -632,31 +734,29 @@ def test_support_varchar_max():
     assert expected == actual
 
 
-def test_support_varbinary_max():
+def test_support_varbinary_max(admin_conn, table_name):
     """
     Support fetching values from a VARBINARY(max) column, by specifying an upper
     bound for the values in it.
     """
     # Given
-    table = "SupportVarbinaryMax"
-    setup_table(table=table, column_type="VARBINARY(max)", values=[])
+    table = table_name
+    setup_table(admin_conn, table=table, column_type="VARBINARY(max)", values=[])
     query = f"SELECT (a) FROM {table}"
 
     # When
     reader = read_arrow_batches_from_odbc(
         query=query, batch_size=1000, connection_string=MSSQL, max_binary_size=1024
     )
-    it = iter(reader)
 
     # Then
     # Implicitly we assert that we could allocate a buffer to hold values for the columns. Better
     # assertion is to check for an inserted value, but inserting binaries is hard with the current
     # test setup.
-    with raises(StopIteration):
-        next(it)
+    drain_none(reader)
 
 
-def test_map_f32_to_f64():
+def test_map_f32_to_f64(admin_conn, table_name):
     """
     ODBC drivers for PostgreSQL seem to have some trouble reporting the precision of floating point
     types correctly. Using schema mapping users of this wheel which know this quirk can adopt to it
@@ -665,10 +765,10 @@ def test_map_f32_to_f64():
     See issue: https://github.com/pacman82/arrow-odbc-py/issues/73
     """
     # Given
-    table = "MapF32ToF64"
+    table = table_name
     # MS driver is pretty good, so we actually create a 32Bit float by setting precision to 17. This
     # way we simulate a driver reporting a too small floating point.
-    setup_table(table=table, column_type="Float(17)", values=[])
+    setup_table(admin_conn, table=table, column_type="Float(17)", values=[])
     query = f"SELECT (a) FROM {table}"
 
     # When
@@ -696,18 +796,16 @@ def test_map_f32_to_f64():
     assert expected == reader.schema
 
 
+@pytest.mark.no_database
 def test_insert_should_raise_on_invalid_connection_string():
     """
     Insert should raise on invalid connection string
     """
     # Given
     invalid_connection_string = "FOO"
-    schema = pa.schema([("a", pa.int64())])
-
-    def iter_record_batches():
-        yield pa.RecordBatch.from_arrays([pa.array([1, 2, 3])], schema=schema)
-
-    reader = pa.RecordBatchReader.from_batches(schema, iter_record_batches())
+    schema = SCHEMA_A_INT64
+    # Connecting fails before the first batch is requested, so we do not need any.
+    reader = pa.RecordBatchReader.from_batches(schema, iter([]))
 
     # When / Then
     with raises(Error, match="Data source name not found"):
@@ -725,11 +823,8 @@ def test_insert_should_raise_on_unsupported_column_type():
     """
     # Given
     schema = pa.schema([("a", pa.dictionary(pa.int32(), pa.int32()))])
-
-    def iter_record_batches():
-        yield pa.RecordBatch.from_arrays([pa.array([(1, 1)])], schema=schema)
-
-    reader = pa.RecordBatchReader.from_batches(schema, iter_record_batches())
+    # The schema is validated before the first batch is requested, so we do not need any.
+    reader = pa.RecordBatchReader.from_batches(schema, iter([]))
 
     # When / Then
     with raises(
@@ -744,14 +839,14 @@ def test_insert_should_raise_on_unsupported_column_type():
         )
 
 
-def test_insert_batches():
+def test_insert_batches(admin_conn, table_name):
     """
     Insert data into database
     """
     # Given
-    table = "InsertBatches"
-    empty_table(table, "BIGINT")
-    schema = pa.schema([("a", pa.int64())])
+    table = table_name
+    empty_table(admin_conn, table, "BIGINT")
+    schema = SCHEMA_A_INT64
 
     def iter_record_batches():
         for i in range(2):
@@ -763,26 +858,44 @@ def test_insert_batches():
     insert_into_table(connection_string=MSSQL, chunk_size=20, table=table, reader=reader)
 
     # Then
-    actual = check_output(
-        ["odbcsv", "fetch", "-c", MSSQL, "-q", f"SELECT a FROM {table} ORDER BY id"]
-    )
-    assert "a\n1\n2\n3\n1\n2\n3\n" == actual.decode("utf8")
+    actual = read_column_a(f"SELECT a FROM {table} ORDER BY id")
+    assert [1, 2, 3, 1, 2, 3] == actual
 
 
-def test_insert_multiple_small_batches():
+def test_insert_batch_larger_than_chunk_size(admin_conn, table_name):
+    """
+    Insert a single batch, which is larger than the chunk size. The rows must be send to the
+    database in multiple bulk roundtrips.
+    """
+    # Given
+    table = table_name
+    empty_table(admin_conn, table, "BIGINT")
+    schema = SCHEMA_A_INT64
+    batch = pa.RecordBatch.from_arrays([pa.array(range(1, 1001), pa.int64())], schema=schema)
+    reader = pa.RecordBatchReader.from_batches(schema, [batch])
+
+    # When
+    insert_into_table(connection_string=MSSQL, chunk_size=500, table=table, reader=reader)
+
+    # Then
+    actual = read_column_a(f"SELECT COUNT(*) AS a FROM {table}")
+    assert [1000] == actual
+
+
+def test_insert_multiple_small_batches(admin_conn, table_name):
     """
     Insert multiple batches into the database, using one roundtrip.
 
     For this test we are sending two batches, each containing one string for the same column. The
     second string is longer than the first one. Is reproduces an issue which occurred in the context
     of chunked arrays.
-    
+
     See issue: https://github.com/pacman82/arrow-odbc-py/issues/115
     """
     # Given
-    table = "InsertBatchesMultipleSmallBatches"
-    empty_table(table, "VARCHAR(10)")
-    schema = pa.schema([("a", pa.utf8())])
+    table = table_name
+    empty_table(admin_conn, table, "VARCHAR(10)")
+    schema = SCHEMA_A_UTF8
 
     def iter_record_batches():
         yield pa.RecordBatch.from_arrays([pa.array(["a"])], schema=schema)
@@ -794,48 +907,38 @@ def test_insert_multiple_small_batches():
     insert_into_table(connection_string=MSSQL, chunk_size=20, table=table, reader=reader)
 
     # Then
-    actual = check_output(
-        ["odbcsv", "fetch", "-c", MSSQL, "-q", f"SELECT a FROM {table} ORDER BY id"]
-    )
-    assert "a\na\nbc\n" == actual.decode("utf8")
+    actual = read_column_a(f"SELECT a FROM {table} ORDER BY id")
+    assert ["a", "bc"] == actual
 
 
-def test_insert_from_parquet():
+def test_insert_from_parquet(admin_conn, table_name, iris_table):
     """
     Insert data into database from a parquet file
     """
     # Given
-    table = "InsertFromParquet"
-    connection = pyodbc.connect(MSSQL)
-    connection.execute(f"DROP TABLE IF EXISTS {table};")
-    connection.execute(
-        f"CREATE TABLE {table} (sepal_length REAL, sepal_width REAL, petal_length REAL, petal_width REAL, variety VARCHAR(20) );"
-    )
-    connection.commit()
-    connection.close()
+    table = table_name
+    create_table(admin_conn, table, IRIS_COLUMNS)
 
     # When
-    arrow_table = pq.read_table("./tests/iris.parquet")
-    from_table_to_db(source=arrow_table, target=table, connection_string=MSSQL)
+    from_table_to_db(source=iris_table, target=table, connection_string=MSSQL)
 
     # Then
     after_roundtrip = read_arrow_batches_from_odbc(
         query=f"SELECT * FROM {table}", batch_size=1000, connection_string=MSSQL
     )
-    assert after_roundtrip.schema == arrow_table.schema
+    assert after_roundtrip.schema == iris_table.schema
     assert len(next(after_roundtrip)) == 150
 
 
-def test_insert_large_string():
+def test_insert_large_string(admin_conn, table_name):
     """
     Insert an arrow table whose schema contains a "large string". Intention of this test is
     to verify that arrow schemas large utf-8 strings. Not necessarily that actually large strings
     are working (although they do).
     """
     # Given
-    table = "InsertLargeString"
-    os.system(f'odbcsv fetch -c "{MSSQL}" -q "DROP TABLE IF EXISTS {table};"')
-    os.system(f'odbcsv fetch -c "{MSSQL}" -q "CREATE TABLE {table} (a NVARCHAR(max))"')
+    table = table_name
+    create_table(admin_conn, table, "a NVARCHAR(max)")
     schema = pa.schema([("a", pa.large_string())])
     large_string = "H" * 2000
 
@@ -849,24 +952,15 @@ def test_insert_large_string():
     insert_into_table(connection_string=MSSQL, chunk_size=20, table=table, reader=reader)
 
     # Then
-    actual = check_output(
-        [
-            "odbcsv",
-            "fetch",
-            "-c",
-            MSSQL,
-            "--max-str-len",
-            "2000",
-            "-q",
-            f"SELECT a FROM {table}",
-        ]
-    )
-    assert f"a\n{large_string}\n" == actual.decode("utf8")
+    actual = read_column_a(f"SELECT a FROM {table}", max_text_size=len(large_string))
+    assert [large_string] == actual
 
 
+@pytest.mark.no_database
 def test_reinitalizing_logger_should_raise():
     """
-    Reinitializin logger should raise
+    Reinitializin logger should raise. The logger has already been initialized once for this
+    process in `pytest_configure` (see `conftest.py`).
     """
     # When / Then
     with raises(
@@ -883,15 +977,11 @@ def test_umlaut_in_column_name():
     """
     query = "SELECT a AS hällo"
     reader = read_arrow_batches_from_odbc(query=query, batch_size=100, connection_string=MSSQL)
-    it = iter(reader)
-    actual = next(it)
+    actual = drain_one(reader)
 
     expected = pa.schema([("hällo", pa.int32(), False)])
     assert expected == actual.schema
 
-    with raises(StopIteration):
-        next(it)
-
 
 def test_odbc_to_duckdb():
     """
@@ -928,17 +1018,16 @@ def test_into_pyarrow_record_batch_reader_transfers_ownership():
     _ = arrow_reader.into_pyarrow_record_batch_reader()
 
     # Then the original record batch reader is empty. I.e. it behaves like a consumed arrow_reader
-    with raises(StopIteration):
-        next(iter(arrow_reader))
+    drain_none(arrow_reader)
 
 
-def test_chunked_arrays_of_variable_length_strings():
+def test_chunked_arrays_of_variable_length_strings(admin_conn, table_name):
     """
     See issue: <https://github.com/pacman82/arrow-odbc-py/issues/115>
     """
     # Given
-    table = "ChunkedArraysOfVariableLengthStrings"
-    empty_table(table, "VARCHAR(3)")
+    table = table_name
+    empty_table(admin_conn, table, "VARCHAR(3)")
 
     # When
     arrow_table = pa.table({"a": pa.chunked_array([["a"], ["bc"]])})
@@ -946,33 +1035,63 @@ def test_chunked_arrays_of_variable_length_strings():
     from_table_to_db(arrow_table, target=table, connection_string=MSSQL)
 
     # Then
-    actual = check_output(
-        ["odbcsv", "fetch", "-c", MSSQL, "-q", f"SELECT a FROM {table} ORDER BY id"]
-    )
-    assert "a\na\nbc\n" == actual.decode("utf8")
+    actual = read_column_a(f"SELECT a FROM {table} ORDER BY id")
+    assert ["a", "bc"] == actual
 
 
+@pytest.mark.slow
+def test_should_not_leak_memory_for_each_batch(shared_iris_table):
+    """
+    Read a bunch of arrow batches and see if the memory traced by the Python interpreter went over a
+    threshold after running GC. Memory allocated by the Rust side is not traced, so it is still
+    worth letting this run manually and see if the process takes more memory over time.
+    """
+
+    def read_iris_batch_by_batch():
+        # Create an individual batch for each row, so a leak per batch adds up quickly
+        reader = read_arrow_batches_from_odbc(
+            query=f"SELECT * FROM {shared_iris_table}", batch_size=1, connection_string=MSSQL
+        )
+        for _ in reader:
+            pass
+
+    # Warm up, so one time allocations (e.g. caches of cffi) do not count against the threshold
+    read_iris_batch_by_batch()
+    tracemalloc.start()
+    try:
+        gc.collect()
+        baseline, _ = tracemalloc.get_traced_memory()
+
+        # When, 20 times 150 rows yields 3000 batches
+        for _ in range(20):
+            read_iris_batch_by_batch()
+
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Then
+    assert current - baseline < 256 * 1024
+
 
 @pytest.mark.slow
-def test_should_not_leak_memory_for_each_batch():
+def test_benchmark_fetch_int_column(benchmark):
     """
-    Read a bunch of arrow batches and see if total memory usage went over a
-    threshold after running GC. Currently I let this run manually and see if
-    the process takes more memory over time as an assertion.
+    Measure the throughput of fetching a single integer column. Compare the results between runs
+    using the options of pytest-benchmark (e.g. `--benchmark-autosave --benchmark-compare`) to
+    detect regressions.
     """
-    # Given
-    table = "ShouldNotLeakMemoryForEachBatch"
-    os.system(f'odbcsv fetch -c "{MSSQL}" -q "DROP TABLE IF EXISTS {table};"')
-    os.system(
-        f'odbcsv fetch -c "{MSSQL}" -q "CREATE TABLE {table} (sepal_length REAL, sepal_width REAL, petal_length REAL, petal_width REAL, variety VARCHAR(20) )"'
+    num_rows = 100_000
+    query = (
+        f"SELECT TOP {num_rows} CAST(ROW_NUMBER() OVER (ORDER BY (SELECT NULL)) AS INT) AS a "
+        "FROM sys.all_objects x CROSS JOIN sys.all_objects y"
     )
-    os.system(f'odbcsv insert -c "{MSSQL}" -i ./tests/iris.csv {table}')
 
-    for _ in range(1):
-        # When, create an individual batch for each row
+    def fetch_all() -> int:
         reader = read_arrow_batches_from_odbc(
-            query=f"SELECT * FROM {table}", batch_size=1, connection_string=MSSQL
+            query=query, batch_size=10_000, connection_string=MSSQL
         )
+        return sum(batch.num_rows for batch in reader)
 
-        for batch in reader:
-            del batch
+    assert benchmark(fetch_all) == num_rows